@@ -53,6 +53,7 @@
 # ## 1. Load flodym and other useful packages
 
 # %%
+from functools import lru_cache
 from os.path import join
 
 import numpy as np
@@ -153,14 +154,13 @@ class VehicleMFA(MFASystem):
         return (stock_diff * 1e-6).to_df()  # in millions
 
     def compute_flows(self):
+        # scale the small material content array first, so the unit conversion is not
+        # applied to the much larger arrays with time and region dimensions
+        material_content = self.parameters["vehicle material content"] * 1e-9
         self.flows["market => use"][...] = (
-            self.parameters["vehicle material content"]
-            * self.parameters["vehicle new registration"]
-            * 1e-9
-        )
-        self.flows["use => waste"][...] = (
-            self.parameters["vehicle material content"] * self.stocks["in use"].outflow * 1e-9
+            material_content * self.parameters["vehicle new registration"]
         )
+        self.flows["use => waste"][...] = material_content * self.stocks["in use"].outflow
         self.flows["waste => scrap"][...] = (
             self.parameters["eol recovery rate"] * self.flows["use => waste"]
         )
@@ -177,6 +177,11 @@ class VehicleMFA(MFASystem):
 
 
 # %%
+@lru_cache(maxsize=None)
+def read_excel_sheet(file_path: str, sheet_name: str) -> pd.DataFrame:
+    return pd.read_excel(file_path, sheet_name)
+
+
 class CustomDataReader(DataReader):
     """The methods `read_dimensions` and `read_parameters` are already defined in the parent
     DataReader class, and loop over the methods `read_dimension` and `read_parameter_values`
@@ -187,21 +192,19 @@ class CustomDataReader(DataReader):
         self.data_directory = data_directory
         self.years = years
 
+    def read_data_file(self, file_name: str) -> pd.DataFrame:
+        # the same files are needed for several dimensions and parameters, so each one is only
+        # parsed once; a copy is returned, so the cached data is not modified.
+        return read_excel_sheet(join(self.data_directory, file_name), "Data").copy()
+
     def read_dimension(self, dimension_definition: DimensionDefinition) -> Dimension:
         if (dim_name := dimension_definition.name) == "region":
-            data = pd.read_excel(
-                join(self.data_directory, "example5_vehicle_lifetime.xlsx"), "Data"
-            )
-            other_data = pd.read_excel(
-                join(self.data_directory, "example5_vehicle_stock.xlsx"), "Data"
-            )
-            data = (set(data[dim_name].unique())).intersection(set(other_data[dim_name].unique()))
-            data = list(data)
-            data.sort()
+            data = self.read_data_file("example5_vehicle_lifetime.xlsx")
+            other_data = self.read_data_file("example5_vehicle_stock.xlsx")
+            # regions present in both data sets, sorted
+            data = np.intersect1d(data[dim_name].unique(), other_data[dim_name].unique()).tolist()
         elif (dim_name := dimension_definition.name) in ["waste", "material"]:
-            data = pd.read_excel(
-                join(self.data_directory, "example5_eol_recovery_rate.xlsx"), "Data"
-            )
+            data = self.read_data_file("example5_eol_recovery_rate.xlsx")
             data.columns = [x.lower() for x in data.columns]
             data = list(data[dim_name].unique())
             data.sort()
@@ -215,33 +218,21 @@ class CustomDataReader(DataReader):
         )
 
     def read_parameter_values(self, parameter_name: str, dims: DimensionSet) -> Parameter:
-        data = pd.read_excel(
-            join(self.data_directory, f"example5_{parameter_name.replace(' ', '_')}.xlsx"), "Data"
-        )
+        data = self.read_data_file(f"example5_{parameter_name.replace(' ', '_')}.xlsx")
         data = data.fillna(0)
         if "r" in dims:  # remove unwanted regions
             data = data[data["region"].isin(dims["r"].items)]
 
         if parameter_name == "vehicle new registration":
-            # add rows with missing years
-            for year in self.years:
-                if year not in data.columns:
-                    data[year] = 0
-            # remove unncessary columns
-            data = data[["region"] + self.years]
+            # add columns with missing years and remove unnecessary columns in one step
+            data = data.reindex(columns=["region"] + self.years, fill_value=0)
         else:
             data.columns = [x.lower() for x in data.columns]
             # remove unncessary columns
             data = data[[dim.name for dim in dims] + ["value"]]
-        if parameter_name == "eol recovery rate":
-            # add rows with missing waste /material combinations
-            waste_material_combinations = [
-                (waste, material) for waste in dims["w"].items for material in dims["m"].items
-            ]
-            data = data.set_index(["waste", "material"])
-            data = data.reindex(waste_material_combinations).reset_index()
-            data = data.fillna(0)
-        return Parameter.from_df(dims=dims, df=data)
+        # waste / material combinations missing from the eol recovery rate data are set to zero
+        allow_missing_values = parameter_name == "eol recovery rate"
+        return Parameter.from_df(dims=dims, df=data, allow_missing_values=allow_missing_values)
 
 
 # %% [markdown]
@@ -307,8 +298,7 @@ fig = px.bar(stock_df, x="material", y="value")
 fig.show(renderer="notebook")
 
 # %%
-np.nan_to_num(vehicle_mfa_2.flows["scrap => sysenv"].values, copy=False)
-scrap_outflow = vehicle_mfa_2.flows["scrap => sysenv"].sum_over(sum_over_dims=("m"))
+scrap_outflow = vehicle_mfa_2.flows["scrap => sysenv"].nansum_over(sum_over_dims=("m"))
 outflow_df = scrap_outflow.to_df(dim_to_columns="waste")
 outflow_df = outflow_df[outflow_df.index > 2017]
 fig = px.line(outflow_df, title="Scrap outflow")
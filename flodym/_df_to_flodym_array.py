@@ -1,4 +1,3 @@
-import itertools
 import logging
 import sys
 from typing import TYPE_CHECKING, Iterable, Literal, Optional
@@ -83,7 +82,11 @@ class DataFrameToFlodymDataConverter:
 
         self.df.columns = self.df.columns.map(strip_if_string)
         self.df.index = self.df.index.map(strip_if_string)
-        self.df = self.df.map(strip_if_string)
+        # numeric columns cannot contain strings and are skipped; all others (object, string,
+        # categorical, ...) are mapped, which for categoricals maps their categories
+        for i, dtype in enumerate(self.df.dtypes):
+            if not pd.api.types.is_numeric_dtype(dtype):
+                self.df.isetitem(i, self.df.iloc[:, i].map(strip_if_string))
 
     def _determine_format(self):
         self._get_dim_columns_by_name_or_letter()
@@ -166,8 +169,7 @@ class DataFrameToFlodymDataConverter:
                 logging.debug(f"Value columns match dimension items of {dim.name}.")
                 self.format = FlodymDataFormat(type="wide", columns_dim=dim.name)
                 if dim.dtype is not None:
-                    for c in value_cols:
-                        self.df.rename(columns={c: dim.dtype(c)}, inplace=True)
+                    self.df.rename(columns={c: dim.dtype(c) for c in value_cols}, inplace=True)
                 return True
         return False
 
@@ -236,7 +238,7 @@ class DataFrameToFlodymDataConverter:
                 raise ValueError(
                     f"FlodymArray has no dimensions, but the DataFrame has {len(self.df)} rows. Expected exactly one row."
                 )
-            return np.array(self.df[self.format.value_column].values[0])
+            return np.array(self.df[self.format.value_column].values[0], dtype=self.target_dtype)
 
         # check for double entries in the index columns
         indices = self.df[list(self.flodym_array.dims.names)]
@@ -271,12 +273,11 @@ class DataFrameToFlodymDataConverter:
                     f"allow_missing_values is set to False. Expected {self.flodym_array.size} "
                     f"rows, but only got {len(self.df)}. Computing missing values...."
                 )
-                expected_index_tuples = set(
-                    itertools.product(*[dim.items for dim in self.flodym_array.dims])
+                expected_index = pd.MultiIndex.from_product(
+                    [dim.items for dim in self.flodym_array.dims]
                 )
-                indices = self.df[list(self.flodym_array.dims.names)]
-                actual_index_tuples = set(indices.itertuples(index=False, name=None))
-                missing_items = expected_index_tuples - actual_index_tuples
+                actual_index = pd.MultiIndex.from_frame(self.df[list(self.flodym_array.dims.names)])
+                missing_items = set(expected_index.difference(actual_index))
                 raise ValueError(
                     f"Detected missing values in the data, but allow_missing_values is set to False. "
                     f"Missing values for index combinations: {missing_items}."
@@ -285,15 +286,14 @@ class DataFrameToFlodymDataConverter:
                 raise ValueError("Empty cells/NaN values in value column!")
 
         # for performance and memory reasons, we use numpy operations to convert the data to the numpy array
-        # replace non-value items in df with their index in dims.items
-        for dim in self.flodym_array.dims:
-            self.df[dim.name] = self.df[dim.name].map({item: i for i, item in enumerate(dim.items)})
-        # convert df to numpy index array: Take all non-value columns
-        fill_indices = self.df.values[:, :-1].T.astype(np.int16)
+        # get the index in dims.items of each non-value item in df via a hash-based lookup
+        fill_indices = tuple(
+            pd.Index(dim.items).get_indexer(self.df[dim.name]) for dim in self.flodym_array.dims
+        )
         fill_values = self.df[self.format.value_column].values
         # this is what ends up in the parameter; initialize with zeros
-        values = np.zeros(self.flodym_array.dims.shape)
-        values[tuple(fill_indices)] = fill_values
+        values = np.zeros(self.flodym_array.dims.shape, dtype=self.target_dtype)
+        values[fill_indices] = fill_values
         return values
 
     @staticmethod
@@ -305,6 +305,14 @@ class DataFrameToFlodymDataConverter:
                 return False
         return len(set(arr).symmetric_difference(set(dim.items))) == 0
 
+    @property
+    def target_dtype(self) -> np.dtype:
+        """Floating point precision of the target FlodymArray values, so that e.g. float32 arrays
+        are not turned into float64 arrays by setting their values from a DataFrame.
+        """
+        dtype = self.flodym_array.values.dtype
+        return dtype if np.issubdtype(dtype, np.floating) else np.dtype(np.float64)
+
     @property
     def error_context(self) -> str:
         return f"While setting values of {self.flodym_array.__class__.__name__} '{self.flodym_array.name}' from DataFrame:"
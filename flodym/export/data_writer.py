@@ -1,7 +1,10 @@
 import logging
 import os
 import pickle
-from typing import Callable
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
 
 from ..mfa_system import MFASystem
 from ..flodym_arrays import FlodymArray
@@ -16,32 +19,43 @@ def export_mfa_to_pickle(mfa: MFASystem, export_path: str):
         export_path (str): The path to the file where the MFA system should be saved.
     """
     dict_out = convert_to_dict(mfa)
-    pickle.dump(dict_out, open(export_path, "wb"))
+    # protocol 5 writes numpy arrays without an intermediate copy of their data
+    with open(export_path, "wb") as file:
+        pickle.dump(dict_out, file, protocol=pickle.HIGHEST_PROTOCOL)
     logging.info(f"Data saved to {export_path}")
 
 
-def export_mfa_flows_to_csv(mfa: MFASystem, export_directory: str):
+def export_mfa_flows_to_csv(
+    mfa: MFASystem, export_directory: str, rows_per_chunk: Optional[int] = None
+):
     """export flows of an MFA system to csv files.
 
     Args:
         mfa (MFASystem): The MFA system from which the flows should be exported.
         export_directory (str): The directory where the csv files should be saved.
+        rows_per_chunk (int, optional): If given, each file is written in blocks of at most this many rows, which bounds the memory used for large flows. Defaults to None, i.e. writing each flow at once.
     """
     if not os.path.exists(export_directory):
         os.makedirs(export_directory)
     for flow_name, flow in mfa.flows.items():
         path_out = os.path.join(export_directory, f"{to_valid_file_name(flow_name)}.csv")
-        flow.to_df().to_csv(path_out)
+        _write_csv(flow, path_out, rows_per_chunk)
     logging.info(f"Data saved in directory {export_directory}")
 
 
-def export_mfa_stocks_to_csv(mfa: MFASystem, export_directory: str, with_in_and_out: bool = False):
+def export_mfa_stocks_to_csv(
+    mfa: MFASystem,
+    export_directory: str,
+    with_in_and_out: bool = False,
+    rows_per_chunk: Optional[int] = None,
+):
     """export stocks of an MFA system to csv files.
 
     Args:
         mfa (MFASystem): The MFA system from which the stocks should be exported.
         export_directory (str): The directory where the csv files should be saved.
         with_in_and_out (bool, optional): If True, the inflow and outflow of the stocks are also exported. Defaults to False.
+        rows_per_chunk (int, optional): If given, each file is written in blocks of at most this many rows, which bounds the memory used for large stocks. Defaults to None, i.e. writing each array at once.
     """
     if not os.path.exists(export_directory):
         os.makedirs(export_directory)
@@ -51,14 +65,32 @@ def export_mfa_stocks_to_csv(mfa: MFASystem, export_directory: str, with_in_and_
             output_items["inflow"] = stock.inflow
             output_items["outflow"] = stock.outflow
         for attribute_name, output in output_items.items():
-            df = output.to_df()
             path_out = os.path.join(
                 export_directory, f"{to_valid_file_name(stock_name)}_{attribute_name}.csv"
             )
-            df.to_csv(path_out)
+            _write_csv(output, path_out, rows_per_chunk)
     logging.info(f"Data saved in directory {export_directory}")
 
 
+def _write_csv(array: FlodymArray, path: str, rows_per_chunk: Optional[int] = None):
+    """Write an array to a csv file in long format, i.e. the same table as ``to_df(index=False)``.
+    If rows_per_chunk is given, the table is built and written in blocks of rows instead of at once.
+    """
+    if rows_per_chunk is not None and rows_per_chunk < 1:
+        raise ValueError("rows_per_chunk must be a positive integer.")
+    values = array.values.ravel()
+    if rows_per_chunk is None or values.size <= rows_per_chunk:
+        array.to_df(index=False).to_csv(path, index=False)
+        return
+    items = [pd.Index(dim.items).to_numpy() for dim in array.dims]
+    for start in range(0, values.size, rows_per_chunk):
+        stop = min(start + rows_per_chunk, values.size)
+        ids = np.unravel_index(np.arange(start, stop), array.shape)
+        columns = {dim.name: items[i][ids[i]] for i, dim in enumerate(array.dims)}
+        df = pd.DataFrame({**columns, "value": values[start:stop]})
+        df.to_csv(path, index=False, mode="w" if start == 0 else "a", header=start == 0)
+
+
 def convert_to_dict(mfa: MFASystem, type: str = "numpy") -> dict:
     """Convert an MFA system to a dictionary which is readable without flodym.
 
@@ -94,16 +126,24 @@ def _convert_to_dict_by_func(mfa: MFASystem, convert_func: Callable) -> dict:
     dict_out["dimension_names"] = {d.letter: d.name for d in mfa.dims}
     dict_out["dimension_items"] = {d.name: d.items for d in mfa.dims}
     dict_out["processes"] = [p.name for p in mfa.processes.values()]
-    dict_out["flows"] = {n: convert_func(f) for n, f in mfa.flows.items()}
-    dict_out["flow_dimensions"] = {n: f.dims.letters for n, f in mfa.flows.items()}
-    dict_out["flow_processes"] = {
-        n: (f.from_process.name, f.to_process.name) for n, f in mfa.flows.items()
-    }
-    dict_out["stocks"] = {s_name: convert_func(s.stock) for s_name, s in mfa.stocks.items()}
-    dict_out["stock_dimensions"] = {
-        s_name: s.stock.dims.letters for s_name, s in mfa.stocks.items()
-    }
-    dict_out["stock_processes"] = {
-        s_name: s.process.name for s_name, s in mfa.stocks.items() if s.process is not None
-    }
+
+    # one pass over flows and stocks each, filling all their entries at once
+    flows, flow_dimensions, flow_processes = {}, {}, {}
+    for n, f in mfa.flows.items():
+        flows[n] = convert_func(f)
+        flow_dimensions[n] = f.dims.letters
+        flow_processes[n] = (f.from_process.name, f.to_process.name)
+    dict_out["flows"] = flows
+    dict_out["flow_dimensions"] = flow_dimensions
+    dict_out["flow_processes"] = flow_processes
+
+    stocks, stock_dimensions, stock_processes = {}, {}, {}
+    for s_name, s in mfa.stocks.items():
+        stocks[s_name] = convert_func(s.stock)
+        stock_dimensions[s_name] = s.stock.dims.letters
+        if s.process is not None:
+            stock_processes[s_name] = s.process.name
+    dict_out["stocks"] = stocks
+    dict_out["stock_dimensions"] = stock_dimensions
+    dict_out["stock_processes"] = stock_processes
     return dict_out
@@ -1,5 +1,7 @@
 """Home to helper functions for working with `FlodymArray`s."""
 
+import numpy as np
+
 from .flodym_arrays import FlodymArray
 from .dimensions import Dimension
 
@@ -26,7 +28,10 @@ def flodym_array_stack(
         raise ValueError(f"Dimension {dimension.letter} already present in FlodymArrays to stack")
     flodym_array0 = flodym_arrays[0]
     extended_dimensions = flodym_array0.dims.append(dimension)
-    extended = flodym_array0.cast_to(extended_dimensions, inplace=inplace)
-    for item, flodym_array in zip(dimension.items, flodym_arrays):
-        extended[{dimension.letter: item}] = flodym_array
-    return extended
+    # all arrays have the same dimension order, so their values can be stacked directly
+    stacked_values = np.stack([flodym_array.values for flodym_array in flodym_arrays], axis=-1)
+    if inplace:
+        flodym_array0.dims = extended_dimensions
+        flodym_array0.values = stacked_values
+        return flodym_array0
+    return FlodymArray(dims=extended_dimensions, values=stacked_values, name=flodym_array0.name)
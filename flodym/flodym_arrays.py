@@ -366,9 +366,10 @@ class FlodymArray(PydanticBaseModel):
             FlodymArray: FlodymArray object with the summed values and the reduced dimensions.
         """
         result_dims = self._tuple_to_letters(result_dims)
+        # einsum returns a transposed view if result_dims are only reordered; store a C-ordered array
         return FlodymArray(
             dims=self.dims.get_subset(result_dims),
-            values=self.sum_values_to(result_dims),
+            values=np.ascontiguousarray(self.sum_values_to(result_dims)),
             name=self.name,
         )
 
@@ -385,7 +386,25 @@ class FlodymArray(PydanticBaseModel):
         result_dims = tuple([d for d in self.dims.letters if d not in sum_over_dims])
         return FlodymArray(
             dims=self.dims.get_subset(result_dims),
-            values=self.sum_values_over(sum_over_dims),
+            values=np.ascontiguousarray(self.sum_values_over(sum_over_dims)),
+            name=self.name,
+        )
+
+    def nansum_over(self, sum_over_dims: tuple = ()) -> "FlodymArray":
+        """Return the FlodymArray summed over a given tuple of dimensions, treating NaN values as zero.
+
+        Args:
+            sum_over_dims (tuple, optional): Tuple of dimension letters to sum over. If not given, no summation is performed, but NaN values are still replaced by zero.
+
+        Returns:
+            FlodymArray: FlodymArray object with the summed values and the reduced dimensions.
+        """
+        sum_over_dims = self._tuple_to_letters(sum_over_dims)
+        result_dims = tuple([d for d in self.dims.letters if d not in sum_over_dims])
+        axes = tuple(i for i, d in enumerate(self.dims.letters) if d in sum_over_dims)
+        return FlodymArray(
+            dims=self.dims.get_subset(result_dims),
+            values=np.nansum(self.values, axis=axes),
             name=self.name,
         )
 
@@ -435,6 +454,9 @@ class FlodymArray(PydanticBaseModel):
         return other
 
     def __add__(self, other: Union["FlodymArray", Number]) -> "FlodymArray":
+        # scalars are broadcast by numpy directly, without building a full-shape array first
+        if isinstance(other, Number):
+            return FlodymArray(dims=self.dims, values=self.values + other)
         other = self._prepare_other(other)
         dims_out = self.dims.intersect_with(other.dims)
         return FlodymArray(
@@ -443,6 +465,8 @@ class FlodymArray(PydanticBaseModel):
         )
 
     def __sub__(self, other: Union["FlodymArray", Number]) -> "FlodymArray":
+        if isinstance(other, Number):
+            return FlodymArray(dims=self.dims, values=self.values - other)
         other = self._prepare_other(other)
         dims_out = self.dims.intersect_with(other.dims)
         return FlodymArray(
@@ -451,6 +475,8 @@ class FlodymArray(PydanticBaseModel):
         )
 
     def __mul__(self, other: Union["FlodymArray", Number]) -> "FlodymArray":
+        if isinstance(other, Number):
+            return FlodymArray(dims=self.dims, values=self.values * other)
         other = self._prepare_other(other)
         dims_out = self.dims.union_with(other.dims)
         values_out = np.einsum(
@@ -459,6 +485,8 @@ class FlodymArray(PydanticBaseModel):
         return FlodymArray(dims=dims_out, values=values_out)
 
     def __truediv__(self, other: Union["FlodymArray", Number]) -> "FlodymArray":
+        if isinstance(other, Number):
+            return FlodymArray(dims=self.dims, values=self.values * np.divide(1.0, other))
         other = self._prepare_other(other)
         dims_out = self.dims.union_with(other.dims)
         values_out = np.einsum(
@@ -589,9 +617,11 @@ class FlodymArray(PydanticBaseModel):
         if isinstance(item, FlodymArray):
             self.values[slice_obj.ids] = item.sum_values_to(slice_obj.dim_letters)
         elif isinstance(keys, type(Ellipsis)):
+            # replaces the values array instead of writing into it, such that arrays sharing the
+            # old values (e.g. the source of a slice) are not modified, and the dtype of the RHS is kept
             self.set_values(copy(item))
         else:
-            self.values[slice_obj.ids] = copy(item)
+            self.values[slice_obj.ids] = item
 
     def to_df(
         self, index: bool = True, dim_to_columns: Optional[str] = None, sparse: bool = False
@@ -617,14 +647,16 @@ class FlodymArray(PydanticBaseModel):
             multiindex = pd.MultiIndex.from_arrays(
                 arrays=[to_index(i) for i in range(self.dims.ndim)], names=self.dims.names
             )
-            df = pd.DataFrame({"value": self.values[non_zero_ids].flatten()})
-            df = df.set_index(multiindex)
+            df = pd.DataFrame({"value": self.values[non_zero_ids]}, index=multiindex)
+        elif not index and dim_to_columns is None:
+            # long format without index: build the item columns directly, without a MultiIndex
+            return pd.DataFrame({**self._item_columns(), "value": self.values.ravel()})
         else:
             multiindex = pd.MultiIndex.from_product(
                 [d.items for d in self.dims], names=self.dims.names
             )
-            df = pd.DataFrame({"value": self.values.flatten()})
-            df = df.set_index(multiindex)
+            # build the frame on the index directly, instead of copying it again in set_index
+            df = pd.DataFrame({"value": self.values.ravel()}, index=multiindex)
         if dim_to_columns is not None:
             if dim_to_columns not in self.dims:
                 raise ValueError(f"Dimension name {dim_to_columns} not found in flodym_array.dims")
@@ -637,6 +669,16 @@ class FlodymArray(PydanticBaseModel):
             df.reset_index(inplace=True)
         return df
 
+    def _item_columns(self) -> dict[str, np.ndarray]:
+        """For each dimension, the items belonging to each entry of the flattened values array."""
+        columns = {}
+        for i, dim in enumerate(self.dims):
+            items = pd.Index(dim.items).to_numpy()
+            n_repeat = int(np.prod(self.shape[i + 1 :]))
+            n_tile = int(np.prod(self.shape[:i]))
+            columns[dim.name] = np.tile(np.repeat(items, n_repeat), n_tile)
+        return columns
+
     def set_values_from_df(
         self,
         df_in: pd.DataFrame,
@@ -891,9 +933,10 @@ class SubArrayHandler:
         items_ids: Union[int, list[int]]
         if isinstance(item_or_items, Dimension):
             if item_or_items.is_subset(self.flodym_array.dims[dim_letter]):
-                items_ids = [
-                    self._get_single_item_id(dim_letter, item) for item in item_or_items.items
-                ]
+                # look-up table for all items at once, built here as the items may have changed
+                all_items = self.flodym_array.dims[dim_letter].items
+                ids = {item: i for i, item in reversed(list(enumerate(all_items)))}
+                items_ids = [ids[item] for item in item_or_items.items]
             else:
                 raise ValueError(
                     "Dimension item given in array index must be a subset of the dimension it replaces"
@@ -905,7 +948,7 @@ class SubArrayHandler:
         self._ids_all_dims[self.flodym_array.dims.index(dim_letter)] = items_ids
 
     def _get_single_item_id(self, dim_letter, item_name) -> int:
-        return self.flodym_array.dims[dim_letter].items.index(item_name)
+        return self.flodym_array.dims[dim_letter].index(item_name)
 
 
 class Flow(FlodymArray):
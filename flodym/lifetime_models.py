@@ -17,6 +17,7 @@ from .gauss_lobatto import gl_nodes, gl_weights
 class UnevenTimeDim(PydanticBaseModel):
     dim: Dimension
     _bounds: np.ndarray = None
+    _interval_lengths: np.ndarray = None
 
     @property
     def bounds(self):
@@ -27,7 +28,9 @@ class UnevenTimeDim(PydanticBaseModel):
     @property
     def interval_lengths(self):
         """Returns the length of the time intervals, i.e. the difference between the bounds."""
-        return np.diff(self.bounds)
+        if self._interval_lengths is None:
+            self._interval_lengths = np.diff(self.bounds)
+        return self._interval_lengths
 
     def compute_t_bounds(self):
         middle = (np.array(self.dim.items[:-1]) + np.array(self.dim.items[1:])) / 2.0
@@ -38,6 +41,7 @@ class UnevenTimeDim(PydanticBaseModel):
                 [middle[-1] + (middle[-1] - middle[-2])],
             )
         )
+        self._interval_lengths = None
 
 
 class LifetimeModel(PydanticBaseModel):
@@ -165,8 +169,33 @@ class LifetimeModel(PydanticBaseModel):
         The method does nothing if the sf alreay exists.
         For example, sf could be assigned to the dynamic stock model from an exogenous computation
         to save time.
+        Positions in the non-time dimensions with identical parameters (e.g. regions with the same
+        lifetime) share the same survival factors, which are therefore only computed once.
         """
         self._check_prms_set()
+        prms = np.stack([np.reshape(prm, (self._n_t, -1)) for prm in self.prms.values()])
+        # one row per position in the non-time dimensions, containing all its parameter values
+        prms_by_position = np.moveaxis(prms, -1, 0).reshape(prms.shape[-1], -1)
+        unique_prms, inverse = np.unique(prms_by_position, axis=0, return_inverse=True)
+        n_unique = unique_prms.shape[0]
+        if n_unique == prms_by_position.shape[0]:
+            self._compute_survival_factor_by_cohort()
+            return
+
+        unique_prms = unique_prms.reshape((n_unique,) + prms.shape[:2])
+        unique_dim_letter = "u" if self.time_letter != "u" else "v"
+        unique_dim = Dimension(
+            name="unique parameters", letter=unique_dim_letter, items=list(range(n_unique))
+        )
+        reduced_prms = {name: unique_prms[:, i, :].T for i, name in enumerate(self.prms)}
+        reduced_model = self.model_copy(
+            update={"dims": DimensionSet(dim_list=[self._t.dim, unique_dim]), **reduced_prms}
+        )
+        reduced_model._sf = np.zeros(reduced_model._shape_cohort)
+        reduced_model._compute_survival_factor_by_cohort()
+        self._sf[...] = reduced_model._sf[..., inverse.reshape(-1)].reshape(self._shape_cohort)
+
+    def _compute_survival_factor_by_cohort(self):
         quad_eta, quad_weights = self.get_quad_points_and_weights()
         for m in range(0, self._n_t):  # cohort index
             for eta, weight in zip(list(quad_eta), list(quad_weights)):
@@ -26,6 +26,11 @@ from .data_reader import (
 )
 
 
+def _max_abs(values: np.ndarray) -> float:
+    """Maximum absolute value of an array, without allocating an array of absolute values."""
+    return max(np.max(values), -np.min(values))
+
+
 class MFASystem(PydanticBaseModel):
     """An MFASystem class handles the calculation of a Material Flow Analysis system, which
     consists of a set of processes, flows, stocks defined over a set of dimensions.
@@ -190,40 +195,62 @@ class MFASystem(PydanticBaseModel):
             A dictionary mapping process names to their mass balance contributions.
             Each contribution is a :py:class:`flodym.FlodymArray` with dimensions common to all contributions.
         """
+        # contributions are stored with their sign, to avoid creating negated copies of the arrays
         contributions = {p: [] for p in self.processes.keys()}
 
         # Add flows to mass balance
         for flow in self.flows.values():
-            contributions[flow.from_process.name].append(-flow)  # Subtract flow from start process
-            contributions[flow.to_process.name].append(flow)  # Add flow to end process
+            contributions[flow.from_process.name].append((-1, flow))  # Subtract from start process
+            contributions[flow.to_process.name].append((1, flow))  # Add flow to end process
 
         # Add stock changes to the mass balance
         for stock in self.stocks.values():
             if stock.process is None:  # not connected to a process
                 continue
-            stock_change = stock.inflow - stock.outflow
+            # stock_change = stock.inflow - stock.outflow
             #    sum(flows_to) - sum(flows_from) = stock_change
             # => sum(flows_to) - sum(flows_from) - stock_change = 0
             # => stock_change is subtracted from the process
-            contributions[stock.process.name].append(-stock_change)
+            contributions[stock.process.name] += [(-1, stock.inflow), (1, stock.outflow)]
             # system_mass_change = sum(stock_changes),
             # where the sysenv process mass balance is the negative system_mass_change:
             # system_mass_change = flows_into_system - flows_out_of_system
             #                    = sum(flows_from_sysenv) - sum(flows_to_sysenv)
             # So stock change is accounted to sysenv process with opposite sign as to other
             # processes => added instead of subtracted.
-            contributions["sysenv"].append(stock_change)
+            contributions["sysenv"] += [(1, stock.inflow), (-1, stock.outflow)]
+
+        return {p_name: self._sum_parts(parts) for p_name, parts in contributions.items()}
+
+    @staticmethod
+    def _sum_parts(parts: list[tuple[int, FlodymArray]]) -> FlodymArray:
+        """Sum a list of signed FlodymArrays like the built-in sum, i.e. reduced to the dimensions
+        common to all of them, but accumulated in a single array instead of creating one per addition.
 
-        return {p_name: sum(parts) for p_name, parts in contributions.items()}
+        Args:
+            parts: list of tuples (sign, array), where sign is 1 for adding and -1 for subtracting.
+        """
+        if not parts:  # as for the built-in sum of an empty list
+            return 0
+        # intersect all dims at once, keeping the order of the first, as repeated intersect_with would
+        first_dims = parts[0][1].dims
+        common = set(first_dims.letters).intersection(*(part.dims.letters for _, part in parts[1:]))
+        dims = first_dims.get_subset([letter for letter in first_dims.letters if letter in common])
+        # accumulate in the dtype the built-in sum would give, instead of always in float64
+        dtype = np.result_type(*(part.values for _, part in parts))
+        total = FlodymArray(dims=dims, values=np.zeros(dims.shape, dtype=dtype))
+        for sign, part in parts:
+            if sign > 0:
+                total.values += part.sum_values_to(dims.letters)
+            else:
+                total.values -= part.sum_values_to(dims.letters)
+        return total
 
     @property
     def _absolute_float_precision(self) -> float:
         """The numpy float precision, multiplied by the maximum absolute flow or stock value."""
-        max_flow_value = max([np.max(np.abs(f.values)) for f in self.flows.values()])
-        if self.stocks:
-            max_stock_value = max([np.max(np.abs(s.stock.values)) for s in self.stocks.values()])
-        else:
-            max_stock_value = 0
+        max_flow_value = max(_max_abs(f.values) for f in self.flows.values())
+        max_stock_value = max((_max_abs(s.stock.values) for s in self.stocks.values()), default=0)
         epsilon = np.finfo(next(iter(self.flows.values())).values.dtype).eps
         return epsilon * max(max_flow_value, max_stock_value)
 
@@ -246,7 +273,7 @@ class MFASystem(PydanticBaseModel):
 
         # returns array with dim [t, process, e]
         balances = self._get_mass_balance()
-        max_errors = {p_name: np.max(np.abs(b.values)) for p_name, b in balances.items()}
+        max_errors = {p_name: _max_abs(b.values) for p_name, b in balances.items()}
         failed = {p_name: e for p_name, e in max_errors.items() if e > tolerance}
         if failed:
             info = ", ".join(f"{p_name} (max error: {e})" for p_name, e in failed.items())
@@ -1,7 +1,9 @@
 """Home to helper functions for the `Stock` class."""
 
+import numpy as np
+
 from .processes import Process
-from .flodym_array_helper import flodym_array_stack
+from .flodym_arrays import StockArray
 from .dimensions import Dimension, DimensionSet
 from .mfa_definition import StockDefinition
 from .stocks import Stock
@@ -14,15 +16,36 @@ def stock_stack(stocks: list[Stock], dimension: Dimension) -> Stock:
     with this function we can combine them to a stock object that contains
     information about all the materials.
     """
-    stacked_stock = flodym_array_stack([stock.stock for stock in stocks], dimension=dimension)
-    stacked_inflow = flodym_array_stack([stock.inflow for stock in stocks], dimension=dimension)
-    stacked_outflow = flodym_array_stack([stock.outflow for stock in stocks], dimension=dimension)
+    if len(stocks) != dimension.len:
+        raise ValueError(
+            f"Length of stocks ({len(stocks)}) must match length of dimension ({dimension.len})"
+        )
+    dims = stocks[0].dims
+    if any(stock.dims != dims for stock in stocks):
+        raise ValueError("All stocks to stack must have the same dimensions")
+    if dimension.letter in dims:
+        raise ValueError(f"Dimension {dimension.letter} already present in stocks to stack")
+    extended_dims = dims.append(dimension)
+
+    # stack stock, inflow and outflow of all stocks into one buffer, and split it into views
+    attributes = ["stock", "inflow", "outflow"]
+    arrays = {a: [getattr(stock, a).values for stock in stocks] for a in attributes}
+    stacked_values = np.empty(
+        (len(attributes),) + extended_dims.shape,
+        dtype=np.result_type(*[v for values in arrays.values() for v in values]),
+    )
+    for i, a in enumerate(attributes):
+        np.stack(arrays[a], axis=-1, out=stacked_values[i])
+    stacked_arrays = {
+        a: StockArray(dims=extended_dims, values=stacked_values[i], name=getattr(stocks[0], a).name)
+        for i, a in enumerate(attributes)
+    }
     return stocks[0].__class__(
-        stock=stacked_stock,
-        inflow=stacked_inflow,
-        outflow=stacked_outflow,
+        dims=extended_dims,
+        **stacked_arrays,
         name=stocks[0].name,
         process=stocks[0].process,
+        time_letter=stocks[0].time_letter,
     )
 
 
@@ -4,7 +4,7 @@ including flow-driven stocks and dynamic (lifetime-based) stocks.
 
 from abc import abstractmethod
 import numpy as np
-from scipy.linalg import solve_triangular
+from scipy.linalg import LinAlgError, get_lapack_funcs
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict, model_validator
 from typing import Optional, Union, TypeVar, Type
 import logging
@@ -17,6 +17,23 @@ from .lifetime_models import LifetimeModel, UnevenTimeDim
 StockSubtype = TypeVar("StockSubtype", bound="Stock")
 
 
+def _is_zero(values: np.ndarray, atol: float = 1e-8) -> bool:
+    """Whether all values are zero within atol, like np.allclose(values, 0), but without
+    allocating a zero array or arrays of absolute values.
+    """
+    return max(np.max(values), -np.min(values)) <= atol
+
+
+def _sum_over_cohorts(cohort_flow: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """Contract a flow by cohort c with a (t, c, ...) kernel like the survival factor, i.e.
+    out[t, ...] = sum_c kernel[t, c, ...] * cohort_flow[c, ...], without building the product.
+    The non-time dimensions are flattened into one, for which einsum has a faster inner loop.
+    """
+    n_t = cohort_flow.shape[0]
+    summed = np.einsum("tck,ck->tk", kernel.reshape(n_t, n_t, -1), cohort_flow.reshape(n_t, -1))
+    return summed.reshape(cohort_flow.shape)
+
+
 class Stock(PydanticBaseModel):
     """Stock objects are components of an MFASystem, where materials can accumulate over time.
     They consist of three :py:class:`flodym.FlodymArray` objects:
@@ -124,7 +141,8 @@ class Stock(PydanticBaseModel):
 
     def check_stock_balance(self):
         balance = self.get_stock_balance()
-        balance = np.max(np.abs(balance).sum(axis=0))
+        # the balance array is not used elsewhere, so absolute values can be taken in place
+        balance = np.abs(balance, out=balance).sum(axis=0).max()
         if balance > 1:  # 1 tonne accuracy
             raise RuntimeError("Stock balance for dynamic stock model is too high: " + str(balance))
         elif balance > 0.001:
@@ -134,18 +152,26 @@ class Stock(PydanticBaseModel):
         """Check whether inflow, outflow, and stock are balanced.
         If possible, the method returns the vector 'Balance', where Balance = inflow - outflow - stock_change
         """
-        dsdt = np.diff(
-            self.stock.values, axis=0, prepend=0
-        )  # stock_change(t) = stock(t) - stock(t-1)
-        return self.inflow.values - self.outflow.values - dsdt
+        # stock_change(t) = stock(t) - stock(t-1), with stock(-1) = 0;
+        # subtracted by slicing in place, such that the balance is the only array allocated
+        stock = self.stock.values
+        balance = self.inflow.values - self.outflow.values
+        balance[0] -= stock[0]
+        balance[1:] -= stock[1:]
+        balance[1:] += stock[:-1]
+        return balance
 
     def _to_whole_period(self, annual_flow: np.ndarray) -> np.ndarray:
         """multiply annual flow by interval length to get flow over whole period."""
-        return np.einsum("t...,t->t...", annual_flow, self._t.interval_lengths)
+        return annual_flow * self._interval_lengths_for(annual_flow)
 
     def _to_annual(self, whole_period_flow: np.ndarray) -> np.ndarray:
         """divide flow over whole period by interval length to get annual flow"""
-        return np.einsum("t...,t->t...", whole_period_flow, 1.0 / self._t.interval_lengths)
+        return whole_period_flow / self._interval_lengths_for(whole_period_flow)
+
+    def _interval_lengths_for(self, flow: np.ndarray) -> np.ndarray:
+        """Interval lengths as a view broadcastable along the first (time) axis of the flow."""
+        return self._t.interval_lengths.reshape((-1,) + (1,) * (flow.ndim - 1))
 
     def __str__(self):
         base = f"{self.__class__.__name__} '{self.name}'"
@@ -157,22 +183,32 @@ class SimpleFlowDrivenStock(Stock):
     """Given inflows and outflows, the stock can be calculated without a lifetime model or cohorts."""
 
     def _check_needed_arrays(self):
-        if (
-            np.max(np.abs(self.inflow.values)) < 1e-10
-            and np.max(np.abs(self.outflow.values)) < 1e-10
-        ):
+        if _is_zero(self.inflow.values, atol=1e-10) and _is_zero(self.outflow.values, atol=1e-10):
             logging.warning("Inflow and Outflow are zero. This will lead to a zero stock.")
 
     def compute(self):
         self._check_needed_arrays()
-        annual_net_inflow = self.inflow.values - self.outflow.values
-        net_inflow_whole_period = self._to_whole_period(annual_net_inflow)
-        self.stock.values[...] = np.cumsum(net_inflow_whole_period, axis=0)
+        # net inflow per period, accumulated over time, computed in place in the stock array.
+        # if the stock cannot hold the result dtype (e.g. an integer stock with non-integer
+        # interval lengths), a temporary of the result dtype is used and assigned to the stock
+        stock = self.stock.values
+        dtype = np.result_type(self.inflow.values, self.outflow.values, self._t.interval_lengths)
+        if np.can_cast(dtype, stock.dtype, casting="same_kind"):
+            net_inflow = stock
+        else:
+            net_inflow = np.empty(stock.shape, dtype=dtype)
+        np.subtract(self.inflow.values, self.outflow.values, out=net_inflow)
+        net_inflow *= self._interval_lengths_for(net_inflow)
+        np.cumsum(net_inflow, axis=0, out=net_inflow)
+        if net_inflow is not stock:
+            stock[...] = net_inflow
 
 
 class DynamicStockModel(Stock):
     """Parent class for dynamic stock models, which are based on stocks having a specified
     lifetime (distribution).
+    Values by cohort are only built on request from the current inflow, and cached until the
+    next :py:meth:`compute`, so they do not reflect later edits of the inflow.
     """
 
     lifetime_model: Union[LifetimeModel, type]
@@ -183,12 +219,6 @@ class DynamicStockModel(Stock):
     _outflow_by_cohort: np.ndarray = None
     _stock_by_cohort: np.ndarray = None
 
-    @model_validator(mode="after")
-    def init_cohort_arrays(self):
-        self._stock_by_cohort = np.zeros(self._shape_cohort)
-        self._outflow_by_cohort = np.zeros(self._shape_cohort)
-        return self
-
     @model_validator(mode="after")
     def init_lifetime_model(self):
         if isinstance(self.lifetime_model, type):
@@ -220,6 +250,8 @@ class DynamicStockModel(Stock):
 
     def get_outflow_by_cohort(self) -> np.ndarray:
         """Outflow by cohort, i.e. the outflow of each production year at each time step."""
+        if self._outflow_by_cohort is None:
+            self._outflow_by_cohort = self.inflow.values[np.newaxis, ...] * self.lifetime_model.pdf
         return self._outflow_by_cohort
 
     def get_stock_by_cohort(self) -> np.ndarray:
@@ -227,10 +259,8 @@ class DynamicStockModel(Stock):
         return self._stock_by_cohort
 
     def _compute_outflow(self):
-        self._outflow_by_cohort = np.einsum(
-            "c...,tc...->tc...", self.inflow.values, self.lifetime_model.pdf
-        )
-        self.outflow.values[...] = self._outflow_by_cohort.sum(axis=1)
+        self.outflow.values[...] = _sum_over_cohorts(self.inflow.values, self.lifetime_model.pdf)
+        self._outflow_by_cohort = None
 
     def copy(self) -> "Stock":
         """Return a copy of the Stock, as :py:meth:`flodym.Stock.copy`, but additionally
@@ -254,7 +284,7 @@ class InflowDrivenDSM(DynamicStockModel):
 
     def _check_needed_arrays(self):
         super()._check_needed_arrays()
-        if np.allclose(self.inflow.values, np.zeros(self.shape)):
+        if _is_zero(self.inflow.values):
             logging.warning("Inflow is zero. This will lead to a zero stock and outflow.")
 
     def compute(self):
@@ -263,13 +293,18 @@ class InflowDrivenDSM(DynamicStockModel):
         self._compute_stock()
         self._compute_outflow()
 
+    def get_stock_by_cohort(self) -> np.ndarray:
+        """Stock by cohort, i.e. the stock of each production year at each time step."""
+        if self._stock_by_cohort is None:
+            inflow_per_period = self._to_whole_period(self.inflow.values)
+            self._stock_by_cohort = inflow_per_period[np.newaxis, ...] * self.lifetime_model.sf
+        return self._stock_by_cohort
+
     def _compute_stock(self):
         # for non-contiguous years, yearly inflow is multiplied with time interval length
         inflow_per_period = self._to_whole_period(self.inflow.values)
-        self._stock_by_cohort = np.einsum(
-            "c...,tc...->tc...", inflow_per_period, self.lifetime_model.sf
-        )
-        self.stock.values[...] = self._stock_by_cohort.sum(axis=1)
+        self.stock.values[...] = _sum_over_cohorts(inflow_per_period, self.lifetime_model.sf)
+        self._stock_by_cohort = None
 
 
 class StockDrivenDSM(DynamicStockModel):
@@ -294,7 +329,7 @@ class StockDrivenDSM(DynamicStockModel):
 
     def _check_needed_arrays(self):
         super()._check_needed_arrays()
-        if np.allclose(self.stock.values, np.zeros(self.shape)):
+        if _is_zero(self.stock.values):
             logging.warning("Stock is zero. This will lead to a zero inflow and outflow.")
 
     def compute(self):
@@ -305,7 +340,7 @@ class StockDrivenDSM(DynamicStockModel):
 
     def _compute_cohorts_and_inflow(self):
         """With given total stock and lifetime distribution,
-        the method builds the stock by cohort and the inflow.
+        the method computes the inflow.
         This involves solving the lower triangular equation system A*x=b,
         where A is the survival function matrix, x is the inflow vector, and b is the stock vector.
         """
@@ -315,14 +350,17 @@ class StockDrivenDSM(DynamicStockModel):
             self._compute_inflow_lapack()
         else:
             raise ValueError(f"Unknown engine: {self.solver}")
+        self._stock_by_cohort = None
 
-        self._stock_by_cohort = np.einsum(
-            "c...,tc...->tc...", self.inflow.values, self.lifetime_model.sf
-        )
+    def get_stock_by_cohort(self) -> np.ndarray:
+        """Stock by cohort, i.e. the stock of each production year at each time step."""
+        if self._stock_by_cohort is None:
+            self._stock_by_cohort = self.inflow.values[np.newaxis, ...] * self.lifetime_model.sf
+        return self._stock_by_cohort
 
     def _compute_inflow_manual(self) -> tuple[np.ndarray]:
         """With given total stock and lifetime distribution,
-        the method builds the stock by cohort and the inflow,
+        the method computes the inflow,
         using a manual algorithm for solving of the equation system (see "solver" doc for details).
         """
         # Maths behind implementation:
@@ -333,26 +371,45 @@ class StockDrivenDSM(DynamicStockModel):
         #   sum_{j=1...i} (sf_i,j inflow_j) = stock_i
         # solve for inflow_i:
         #   inflow_i = ( stock_i - sum_{j=1...i-1}(sf_i,j * inflow_j) ) / sf_ii
-        inflow_whole_period = np.zeros_like(self.inflow.values)
-        for i in range(self._n_t):
-            stock_i = self.stock.values[i, ...]
-            sf_ij = self.lifetime_model.sf[i, :i, ...]
-            inflow_j = inflow_whole_period[:i, ...]
-            sf_ii = self.lifetime_model.sf[i, i, ...]
-
-            inflow_whole_period[i, ...] = (stock_i - (sf_ij * inflow_j).sum(axis=0)) / sf_ii
-        self.inflow.values[...] = self._to_annual(inflow_whole_period)
+        # flatten the non-time dimensions, such that each row is one einsum contraction over j,
+        # without allocating the product sf_ij * inflow_j
+        n_t = self._n_t
+        sf = self.lifetime_model.sf.reshape(n_t, n_t, -1)
+        stock = self.stock.values.reshape(n_t, -1)
+        # solve directly into the inflow array; rows are written before they are read.
+        # each row is computed in a scratch row with the precision of sf and stock, and then
+        # assigned, as the inflow may have a lower precision (e.g. float32)
+        inflow = self.inflow.values
+        inflow_whole_period = inflow.reshape(n_t, -1)
+        inflow_i = np.empty(stock.shape[1], dtype=np.result_type(sf, stock, inflow))
+        for i in range(n_t):
+            np.einsum("jk,jk->k", sf[i, :i], inflow_whole_period[:i], out=inflow_i)
+            np.subtract(stock[i], inflow_i, out=inflow_i)
+            inflow_i /= sf[i, i]
+            inflow_whole_period[i] = inflow_i
+        if not np.shares_memory(inflow_whole_period, inflow):  # reshape had to copy
+            inflow[...] = inflow_whole_period.reshape(self.shape)
+        inflow /= self._interval_lengths_for(inflow)
 
     def _compute_inflow_lapack(self) -> tuple[np.ndarray]:
         """With given total stock and lifetime distribution,
-        the method builds the stock by cohort and the inflow,
+        the method computes the inflow,
         using lapack for solving of the equation system (see "engine" doc for details).
         """
         sf = self.lifetime_model.sf
+        stock = self.stock.values
         slt = (slice(None),)
-        inflow_whole_period = np.zeros_like(self.inflow.values)
+        # call the lapack routine directly, without scipy's per-call input checks of solve_triangular;
+        # its check for non-finite values is done once here for all non-time indices
+        if not (np.isfinite(sf).all() and np.isfinite(stock).all()):
+            raise ValueError("Survival factor and stock must not contain infs or NaNs.")
+        (trtrs,) = get_lapack_funcs(("trtrs",), (sf, stock))
+        # solve directly into the inflow array, which is then converted to annual values in place
+        inflow = self.inflow.values
         for i in np.ndindex(self._shape_no_t):
-            inflow_whole_period[slt + i] = solve_triangular(
-                sf[2 * slt + i], self.stock.values[slt + i], lower=True
-            )
-        self.inflow.values[...] = self._to_annual(inflow_whole_period)
+            inflow[slt + i], info = trtrs(sf[2 * slt + i], stock[slt + i], lower=1)
+            if info > 0:
+                raise LinAlgError(f"singular matrix: resolution failed at diagonal {info - 1}")
+            if info < 0:
+                raise ValueError(f"illegal value in {-info}th argument of internal trtrs")
+        inflow /= self._interval_lengths_for(inflow)
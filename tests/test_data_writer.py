@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from flodym import Dimension, DimensionSet, Flow, MFASystem, SimpleFlowDrivenStock, StockArray
+from flodym.export import export_mfa_flows_to_csv, export_mfa_stocks_to_csv
+from flodym.processes import make_processes
+
+
+class _ExportMFASystem(MFASystem):
+    def compute(self):
+        pass
+
+
+def _make_mfa():
+    dims = DimensionSet(
+        dim_list=[
+            Dimension(name="time", letter="t", items=[2000, 2001, 2002]),
+            Dimension(name="region", letter="r", items=["EUR", "USA"]),
+            Dimension(name="material", letter="m", items=["steel", "copper", "wood", "glass"]),
+        ]
+    )
+    processes = make_processes(["sysenv", "use"])
+    flows = {
+        "sysenv => use": Flow(
+            from_process=processes["sysenv"],
+            to_process=processes["use"],
+            dims=dims,
+            values=np.random.rand(*dims.shape),
+        ),
+        "use => sysenv": Flow(
+            from_process=processes["use"],
+            to_process=processes["sysenv"],
+            dims=dims["t", "m"],
+            values=np.random.rand(*dims["t", "m"].shape),
+        ),
+    }
+    stock = SimpleFlowDrivenStock(
+        dims=dims,
+        inflow=StockArray(dims=dims, values=np.random.rand(*dims.shape)),
+        outflow=StockArray(dims=dims, values=np.random.rand(*dims.shape)),
+        process=processes["use"],
+        time_letter="t",
+    )
+    stock.compute()
+    return _ExportMFASystem(
+        dims=dims, parameters={}, processes=processes, flows=flows, stocks={"use": stock}
+    )
+
+
+def _read_files(directory) -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in sorted(directory.iterdir())}
+
+
+def test_chunked_csv_export_matches_single_write(tmp_path):
+    mfa = _make_mfa()
+
+    export_mfa_flows_to_csv(mfa, tmp_path / "full" / "flows")
+    export_mfa_stocks_to_csv(mfa, tmp_path / "full" / "stocks", with_in_and_out=True)
+    expected_flows = _read_files(tmp_path / "full" / "flows")
+    expected_stocks = _read_files(tmp_path / "full" / "stocks")
+    assert len(expected_flows) == 2
+    assert len(expected_stocks) == 3
+
+    for rows_per_chunk in (1, 5, 24, 100):
+        directory = tmp_path / f"chunked_{rows_per_chunk}"
+        export_mfa_flows_to_csv(mfa, directory / "flows", rows_per_chunk=rows_per_chunk)
+        export_mfa_stocks_to_csv(
+            mfa, directory / "stocks", with_in_and_out=True, rows_per_chunk=rows_per_chunk
+        )
+        assert _read_files(directory / "flows") == expected_flows
+        assert _read_files(directory / "stocks") == expected_stocks
+
+
+def test_csv_export_rejects_non_positive_rows_per_chunk(tmp_path):
+    mfa = _make_mfa()
+
+    for rows_per_chunk in (0, -1):
+        with pytest.raises(ValueError, match="rows_per_chunk"):
+            export_mfa_flows_to_csv(mfa, tmp_path / "flows", rows_per_chunk=rows_per_chunk)
+        with pytest.raises(ValueError, match="rows_per_chunk"):
+            export_mfa_stocks_to_csv(mfa, tmp_path / "stocks", rows_per_chunk=rows_per_chunk)
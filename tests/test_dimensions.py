@@ -349,6 +349,32 @@ def test_dimensionset_total_size():
     assert dim_set.total_size == 6
 
 
+def test_dimension_item_index():
+    """Test that item indices are found, also after the items have changed."""
+    dim = Dimension(name="time", letter="t", items=[1990, 2000, 2010])
+    assert dim.index(2000) == 1
+    with pytest.raises(ValueError):
+        dim.index(2020)
+
+    # the lookup table is not part of the dimension's equality
+    assert dim == Dimension(name="time", letter="t", items=[1990, 2000, 2010])
+
+    dim.items.append(2020)
+    assert dim.index(2020) == 3
+    dim.items = [2020, 2030]
+    assert dim.index(2030) == 1
+
+    # in-place changes which keep the number of items
+    dim.items[1] = 2035
+    assert dim.index(2035) == 1
+    with pytest.raises(ValueError):
+        dim.index(2030)
+    dim = Dimension(name="letters", letter="l", items=["c", "b", "a"])
+    assert dim.index("a") == 2
+    dim.items.sort()
+    assert dim.index("a") == 0
+
+
 def test_dimension_as_dimset():
     """Test that as_dimset() converts a Dimension to a DimensionSet."""
     dim = Dimension(name="time", letter="t", items=[1990, 2000, 2010])
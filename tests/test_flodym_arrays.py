@@ -121,6 +121,27 @@ def test_sum_to():
     with pytest.raises(KeyError):
         space_animals.sum_over(sum_over_dims=("s"))
 
+    # reordering without summation still gives a C-contiguous array
+    reordered = space_animals.sum_to(result_dims=("a", "t", "p"))
+    assert reordered.values.flags["C_CONTIGUOUS"]
+    assert_array_equal(reordered.values, np.transpose(animal_values, (2, 1, 0)))
+
+
+def test_nansum_over():
+    nan_values = animal_values.copy()
+    nan_values[0, 1, 0] = np.nan
+    nan_animals = FlodymArray(dims=dims_incl_animals, values=nan_values)
+
+    summed_over = nan_animals.nansum_over(sum_over_dims=("p", "a"))
+    assert summed_over.dims == DimensionSet(dim_list=[time])
+    assert_array_almost_equal(summed_over.values, np.nansum(nan_values, axis=(0, 2)))
+
+    # without dimensions to sum over, only NaN values are replaced
+    not_summed = nan_animals.nansum_over()
+    assert not_summed.dims == dims_incl_animals
+    assert_array_almost_equal(not_summed.values, np.nan_to_num(nan_values))
+    assert np.isnan(nan_animals.values[0, 1, 0])
+
 
 def test_get_shares_over():
     # example of getting shares over one dimension
@@ -184,6 +205,53 @@ def test_maths():
     assert_array_almost_equal(divided_flipped.values[:, :, 1], values / (animal_values[:, :, 1]))
 
 
+def test_setitem_ellipsis_replaces_values():
+    result = numbers.copy()
+    new_values = np.random.rand(4, 3)
+    result[...] = new_values
+    assert_array_equal(result.values, new_values)
+    new_values[0, 0] = -1.0
+    assert result.values[0, 0] != -1.0
+    with pytest.raises(ValueError):
+        result[...] = np.random.rand(4)
+
+
+def test_setitem_ellipsis_does_not_write_through():
+    original = numbers.copy()
+    original_values = original.values.copy()
+
+    sub_array = original[{"p": "Earth"}]
+    sub_array[...] = np.zeros(sub_array.shape)
+    assert_array_equal(original.values, original_values)
+
+    summed = original.sum_to(original.dims.letters)
+    summed[...] = np.zeros(summed.shape)
+    assert_array_equal(original.values, original_values)
+
+
+def test_setitem_ellipsis_keeps_dtype_of_rhs():
+    int_array = FlodymArray(dims=dims, values=np.zeros(dims.shape, dtype=int))
+    int_array[...] = np.full(dims.shape, 0.7)
+    assert int_array.values.dtype == np.float64
+    assert_array_equal(int_array.values, 0.7)
+
+
+def test_maths_with_scalar():
+    for result, expected in [
+        (space_animals + 2, animal_values + 2),
+        (space_animals - 2, animal_values - 2),
+        (2 - space_animals, 2 - animal_values),
+        (space_animals * 2, animal_values * 2),
+        (2 * space_animals, animal_values * 2),
+        (space_animals / 2, animal_values / 2),
+        (2 / space_animals, 2 / animal_values),
+    ]:
+        assert result.dims == dims_incl_animals
+        assert_array_almost_equal(result.values, expected)
+    # original array is not modified
+    assert_array_equal(space_animals.values, animal_values)
+
+
 def test_sub_array_handler():
     space_cat = space_animals["cat"]  # space cat from str
     another_space_cat = space_animals[{"a": "cat"}]  # space cat from dict
@@ -316,6 +384,46 @@ def test_to_df():
         df.loc[("Earth", 2000, "mouse"), "value"]
 
 
+def test_to_df_without_index():
+    df = space_animals.to_df(index=False)
+    pd.testing.assert_frame_equal(df, space_animals.to_df().reset_index())
+    assert list(df.columns) == ["place", "time", "animal", "value"]
+
+
+def test_from_df_dimension_with_many_items():
+    # more items than fit into a 16-bit integer index
+    ids = Dimension(name="id", letter="i", items=list(range(40000)))
+    values = np.arange(40000.0) + 0.5
+    df = pd.DataFrame({"id": ids.items[::-1], "value": values[::-1]})
+
+    result = FlodymArray.from_df(dims=DimensionSet(dim_list=[ids]), df=df)
+
+    assert_array_equal(result.values, values)
+
+
+def test_from_df_reports_missing_index_combinations():
+    selected_places = Dimension(name="place", letter="p", items=["Earth", "Sun"])
+    df = pd.DataFrame(
+        {"place": ["Earth", "Earth", "Sun"], "time": [1990, 2000, 1990], "value": [1.5, 2.5, 3.5]}
+    )
+    dims_subset = DimensionSet(dim_list=[selected_places, historic_time])
+
+    with pytest.raises(ValueError, match=r"\('Sun', 2000\)"):
+        FlodymArray.from_df(dims=dims_subset, df=df)
+
+
+def test_set_values_from_df_keeps_float_precision():
+    df = pd.DataFrame({"time": [1990, 2000], "value": [1.5, 2.5]})
+    historic = FlodymArray(
+        dims=DimensionSet(dim_list=[historic_time]), values=np.zeros(2, dtype=np.float32)
+    )
+
+    historic.set_values_from_df(df)
+
+    assert historic.values.dtype == np.float32
+    assert_array_equal(historic.values, np.array([1.5, 2.5], dtype=np.float32))
+
+
 def test_from_df_strips_whitespace_when_enabled():
     selected_places = Dimension(name="place", letter="p", items=["Earth", "Sun"])
     df = pd.DataFrame(
@@ -332,6 +440,22 @@ def test_from_df_strips_whitespace_when_enabled():
     assert_array_equal(result.values, np.array([[1.0, 2.0], [3.0, 4.0]]))
 
 
+def test_from_df_strips_whitespace_from_categorical_columns():
+    selected_places = Dimension(name="place", letter="p", items=["Earth", "Sun"])
+    df = pd.DataFrame(
+        {
+            "place": pd.Categorical([" Earth", " Earth", "Sun ", "Sun "]),
+            "time": [1990, 2000, 1990, 2000],
+            "value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    dims_subset = DimensionSet(dim_list=[selected_places, historic_time])
+
+    result = FlodymArray.from_df(dims=dims_subset, df=df, strip_whitespace=True)
+
+    assert_array_equal(result.values, np.array([[1.0, 2.0], [3.0, 4.0]]))
+
+
 def test_from_df_does_not_strip_whitespace_when_disabled():
     selected_places = Dimension(name="place", letter="p", items=["Earth", "Sun"])
     df = pd.DataFrame(
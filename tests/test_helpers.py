@@ -34,6 +34,18 @@ def test_flodym_array_stack(new_dim_length):
     assert stacked.dims.dim_list[-1] == additional_dim
 
 
+def test_flodym_array_stack_inplace():
+    flodym_arrays = [FlodymArrayFactory.build() for _ in range(2)]
+    first_values = flodym_arrays[0].values.copy()
+    additional_dim = Dimension(name="extra", letter="x", items=["a", "b"])
+    stacked = flodym_array_stack(flodym_arrays, additional_dim, inplace=True)
+
+    assert stacked is flodym_arrays[0]
+    assert stacked.dims.letters == ("t", "p", "x")
+    assert_array_equal(stacked.values[..., 0], first_values)
+    assert_array_equal(stacked.values[..., 1], flodym_arrays[1].values)
+
+
 def test_flodym_array_split():
     flodym_arrays = [FlodymArrayFactory.build() for _ in range(3)]
     items = ["pre-industrial", 1950, 2000]
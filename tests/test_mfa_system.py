@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
 
 from flodym import (
     DataReader,
     Dimension,
     DimensionDefinition,
+    DimensionSet,
+    FlodymArray,
     FlowDefinition,
     MFADefinition,
     MFASystem,
@@ -77,3 +80,58 @@ def test_mass_balance_check_without_stocks_for_simple_system():
     mfa.flows["process => sysenv"][...] = 1.0
     with pytest.raises(ValueError, match="Mass balance check failed"):
         mfa.check_mass_balance(tolerance=1e-12, raise_error=True)
+
+
+def test_mass_balance_check_for_flows_with_different_dimensions():
+    definition = MFADefinition(
+        dimensions=[
+            DimensionDefinition(name="time", letter="t", dtype=int),
+            DimensionDefinition(name="region", letter="r", dtype=str),
+        ],
+        processes=["sysenv", "process"],
+        flows=[
+            FlowDefinition(
+                from_process_name="sysenv",
+                to_process_name="process",
+                dim_letters=("t", "r"),
+            ),
+            FlowDefinition(
+                from_process_name="process",
+                to_process_name="sysenv",
+                dim_letters=("t",),
+            ),
+        ],
+    )
+    data_reader = _SingleDimDataReader(
+        items_by_dimension_name={"time": [2020, 2021], "region": ["a", "b"]}
+    )
+
+    mfa = _MinimalMFASystem.from_data_reader(definition=definition, data_reader=data_reader)
+
+    # balances are compared on the dimensions common to all flows of a process
+    mfa.flows["sysenv => process"][...] = 1.5
+    mfa.flows["process => sysenv"][...] = 3.0
+    balances = mfa._get_mass_balance()
+    assert balances["process"].dims.letters == ("t",)
+    mfa.check_mass_balance(raise_error=True)
+
+    mfa.flows["sysenv => process"][{"r": "a"}] = 2.0
+    with pytest.raises(ValueError, match="Mass balance check failed"):
+        mfa.check_mass_balance(tolerance=1e-12, raise_error=True)
+
+
+def test_sum_parts_keeps_dtype_of_parts():
+    dims = DimensionSet(
+        dim_list=[
+            Dimension(name="time", letter="t", items=[2020, 2021]),
+            Dimension(name="region", letter="r", items=["a", "b"]),
+        ]
+    )
+    inflow = FlodymArray(dims=dims, values=np.full(dims.shape, 1.5, dtype=np.float32))
+    outflow = FlodymArray(dims=dims["t",], values=np.full((2,), 3.0, dtype=np.float32))
+
+    balance = MFASystem._sum_parts([(1, inflow), (-1, outflow)])
+
+    assert balance.dims.letters == ("t",)
+    assert balance.values.dtype == np.float32
+    np.testing.assert_array_equal(balance.values, np.zeros(2, dtype=np.float32))
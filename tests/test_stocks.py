@@ -1,10 +1,11 @@
 import numpy as np
 import pytest
+from scipy.linalg import LinAlgError
 
 from flodym.dimensions import Dimension, DimensionSet
 from flodym.flodym_arrays import StockArray
 from flodym.mfa_definition import StockDefinition
-from flodym.stock_helper import make_empty_stocks
+from flodym.stock_helper import make_empty_stocks, stock_stack
 from flodym.stocks import InflowDrivenDSM, StockDrivenDSM, SimpleFlowDrivenStock
 from flodym.lifetime_models import LogNormalLifetime
 
@@ -51,6 +52,7 @@ def test_stocks():
     stock_driven_dsm.compute()
     inflow_post = stock_driven_dsm.inflow
     assert np.allclose(inflow.values, inflow_post.values)
+    assert np.allclose(stock_driven_dsm.get_stock_by_cohort().sum(axis=1), stock_fda.values)
 
     stock_driven_dsm = StockDrivenDSM(
         dims=dims,
@@ -103,6 +105,61 @@ def test_simple_stock_copy():
         assert not np.any(getattr(stock_copy, attr).values == -1.0)
 
 
+def test_stock_balance():
+    """A computed stock balances with its inflow and outflow, and an offset shows up in the balance."""
+    inflow = StockArray(dims=dims, values=np.random.rand(dims["t"].len, 2))
+    outflow = StockArray(dims=dims, values=0.5 * np.random.rand(dims["t"].len, 2))
+    stock = SimpleFlowDrivenStock(dims=dims, inflow=inflow, outflow=outflow, time_letter="t")
+    stock.compute()
+    assert np.allclose(stock.get_stock_balance(), 0.0)
+
+    stock.stock.values[5:] += 2.0
+    expected = np.zeros(stock.shape)
+    expected[5] = -2.0
+    assert np.allclose(stock.get_stock_balance(), expected)
+    with pytest.raises(RuntimeError):
+        stock.check_stock_balance()
+
+
+def test_simple_stock_with_integer_values():
+    """Integer stock arrays are computed as before, i.e. the net inflow is accumulated in the result
+    dtype of flows and interval lengths and assigned to the stock."""
+    inflow = StockArray(dims=dims, values=np.full(dims.shape, 3))
+    outflow = StockArray(dims=dims, values=np.ones(dims.shape, dtype=int))
+    stock = StockArray(dims=dims, values=np.zeros(dims.shape, dtype=int))
+    simple_stock = SimpleFlowDrivenStock(
+        dims=dims, stock=stock, inflow=inflow, outflow=outflow, time_letter="t"
+    )
+    simple_stock.compute()
+    expected = np.cumsum(
+        (inflow.values - outflow.values) * simple_stock._t.interval_lengths[:, np.newaxis], axis=0
+    )
+    assert simple_stock.stock.values.dtype == int
+    assert np.array_equal(simple_stock.stock.values, expected)
+
+
+def test_stock_stack():
+    """Stacking stocks combines their stock, inflow and outflow on a new last dimension."""
+    stocks = []
+    for scale in (1.0, 2.0):
+        inflow = StockArray(dims=dims, values=scale * np.ones((dims["t"].len, 2)))
+        stock = SimpleFlowDrivenStock(dims=dims, inflow=inflow, name="single")
+        stock.compute()
+        stocks.append(stock)
+    material = Dimension(name="material", letter="m", items=["steel", "copper"])
+
+    stacked = stock_stack(stocks, material)
+
+    assert isinstance(stacked, SimpleFlowDrivenStock)
+    assert stacked.dims.letters == ("t", "a", "m")
+    for attr in ("stock", "inflow", "outflow"):
+        stacked_array = getattr(stacked, attr)
+        assert isinstance(stacked_array, StockArray)
+        assert stacked_array.dims.letters == stacked.dims.letters
+        for i, stock in enumerate(stocks):
+            assert np.array_equal(stacked_array.values[..., i], getattr(stock, attr).values)
+
+
 def test_dynamic_stock_copy():
     """Copying a dynamic stock yields independent arrays and an independent lifetime model."""
     inflow_values = np.exp(-(np.linspace(-2, 2, 201) ** 2))
@@ -289,3 +346,91 @@ def test_make_empty_stocks_accepts_explicit_nondefault_time_letter():
     stocks = make_empty_stocks([stock_definition], processes={}, dims=stock_dims)
 
     assert stocks["stock_with_nondefault_time"].time_letter == "s"
+
+
+def test_inflow_driven_stock_by_cohort():
+    """Stock and outflow by cohort are consistent with the totals, even though they are only built
+    on request."""
+    inflow_values = np.exp(-(np.linspace(-2, 2, 201) ** 2))
+    inflow_values = np.stack([inflow_values, inflow_values]).T
+    inflow = StockArray(dims=dims, values=inflow_values)
+    lifetime_model = LogNormalLifetime(dims=dims, time_letter="t", mean=60, std=25)
+    dsm = InflowDrivenDSM(dims=dims, inflow=inflow, lifetime_model=lifetime_model, time_letter="t")
+    dsm.compute()
+
+    stock_by_cohort = dsm.get_stock_by_cohort()
+    assert stock_by_cohort.shape == (201,) + dims.shape
+    assert np.allclose(stock_by_cohort.sum(axis=1), dsm.stock.values)
+
+    outflow_by_cohort = dsm.get_outflow_by_cohort()
+    assert outflow_by_cohort.shape == (201,) + dims.shape
+    assert np.allclose(outflow_by_cohort.sum(axis=1), dsm.outflow.values)
+
+
+def test_stock_driven_solvers_with_float32_inflow():
+    stock_values = np.linspace(1.0, 3.0, 201, dtype=np.float32)
+    stock_values = np.stack([stock_values, 2 * stock_values]).T
+    lifetime_model = LogNormalLifetime(dims=dims, time_letter="t", mean=60, std=25)
+    inflows = {}
+    for solver in ["manual", "lapack"]:
+        dsm = StockDrivenDSM(
+            dims=dims,
+            stock=StockArray(dims=dims, values=stock_values.copy()),
+            inflow=StockArray(dims=dims, values=np.zeros(dims.shape, dtype=np.float32)),
+            lifetime_model=lifetime_model,
+            time_letter="t",
+            solver=solver,
+        )
+        dsm.compute()
+        assert dsm.inflow.values.dtype == np.float32
+        inflows[solver] = dsm.inflow.values
+    assert np.allclose(inflows["manual"], inflows["lapack"], rtol=1e-4, atol=1e-6)
+
+
+def _lapack_stock_driven_dsm():
+    stock = StockArray(dims=dims, values=np.ones(dims.shape))
+    lifetime_model = LogNormalLifetime(dims=dims, time_letter="t", mean=60, std=25)
+    return StockDrivenDSM(
+        dims=dims, stock=stock, lifetime_model=lifetime_model, time_letter="t", solver="lapack"
+    )
+
+
+def test_lapack_solver_rejects_non_finite_input():
+    dsm = _lapack_stock_driven_dsm()
+    dsm.stock.values[10, 1] = np.nan
+    with pytest.raises(ValueError, match="infs or NaNs"):
+        dsm.compute()
+
+    dsm = _lapack_stock_driven_dsm()
+    dsm.lifetime_model.sf[20, 10, 0] = np.inf
+    with pytest.raises(ValueError, match="infs or NaNs"):
+        dsm.compute()
+
+
+def test_lapack_solver_raises_for_singular_survival_factor():
+    dsm = _lapack_stock_driven_dsm()
+    dsm.lifetime_model.sf[5, 5, 1] = 0.0
+    with pytest.raises(LinAlgError, match="singular matrix"):
+        dsm.compute()
+
+
+@pytest.mark.parametrize("n_pts_per_interval", [1, 3])
+def test_survival_factor_with_repeated_parameters(n_pts_per_interval):
+    """Survival factors are the same whether or not positions with equal parameters are deduplicated."""
+    regions = Dimension(name="region", letter="r", items=["a", "b", "c", "d"])
+    dims_tr = DimensionSet(dim_list=[dims["t"], regions])
+    mean = np.tile([20.0, 35.0, 20.0, 35.0], (dims_tr["t"].len, 1))
+    std = 0.3 * mean
+
+    lifetime_model = LogNormalLifetime(
+        dims=dims_tr, time_letter="t", mean=mean, std=std, n_pts_per_interval=n_pts_per_interval
+    )
+    for i_r in range(regions.len):
+        single_region_model = LogNormalLifetime(
+            dims=dims_tr.get_subset(("t",)),
+            time_letter="t",
+            mean=mean[:, i_r],
+            std=std[:, i_r],
+            n_pts_per_interval=n_pts_per_interval,
+        )
+        np.testing.assert_allclose(lifetime_model.sf[..., i_r], single_region_model.sf)